@@ -1,77 +1,435 @@
 import os
+import stat
 import win32security
-import datetime
+import win32file
 import json
-import math
+import struct
+import sys
 import time
 import concurrent.futures
+import multiprocessing
 from pathlib import Path
 import argparse
-from tqdm import tqdm
-import queue
+import array
+import gzip
+import heapq
+import shutil
+from dataclasses import dataclass, field
 import threading
 import webbrowser
 
-def get_file_owner(file_path):
-    """Get the owner/author of a file."""
-    try:
-        sd = win32security.GetFileSecurity(file_path, win32security.OWNER_SECURITY_INFORMATION)
-        owner_sid = sd.GetSecurityDescriptorOwner()
-        name, domain, type = win32security.LookupAccountSid(None, owner_sid)
-        return f"{domain}\\{name}"
-    except Exception:
-        return "Unknown"
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved owner names keyed by SID string. A disk usually has only a handful
+# of distinct owners, so LookupAccountSid is called once per SID, not per file.
+_sid_cache = {}
+_sid_cache_lock = threading.Lock()
+
+def long_path(path):
+    """
+    Prefix an absolute Windows path with \\\\?\\ for Win32 calls.
+    
+    The prefix lifts the 260 character MAX_PATH limit, so deep trees don't
+    fail with path errors. Paths shown in the output stay unprefixed.
+    """
+    if os.name != "nt" or path.startswith("\\\\?\\"):
+        return path
+    if path.startswith("\\\\"):
+        return "\\\\?\\UNC\\" + path[2:]
+    return "\\\\?\\" + path
 
-def get_file_stats(file_path):
-    """Get last modified and last accessed times for a file."""
+def get_owner_sid(file_path):
+    """Get the owner SID of a file as a string, or None if it can't be read."""
     try:
-        stat_info = os.stat(file_path)
-        return {
-            "modified": datetime.datetime.fromtimestamp(stat_info.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-            "accessed": datetime.datetime.fromtimestamp(stat_info.st_atime).strftime('%Y-%m-%d %H:%M:%S')
-        }
+        sd = win32security.GetFileSecurity(long_path(file_path), win32security.OWNER_SECURITY_INFORMATION)
+        return win32security.ConvertSidToStringSid(sd.GetSecurityDescriptorOwner())
     except Exception:
-        return {"modified": "Unknown", "accessed": "Unknown"}
+        return None
+
+def get_account_name(sid_string):
+    """Resolve an owner SID string to DOMAIN\\name."""
+    # dict.get is atomic under the GIL, so the common hit path takes no lock
+    owner = _sid_cache.get(sid_string)
+    if owner is None:
+        try:
+            owner_sid = win32security.ConvertStringSidToSid(sid_string)
+            name, domain, type = win32security.LookupAccountSid(None, owner_sid)
+            owner = sys.intern(f"{domain}\\{name}")
+        except Exception:
+            owner = "Unknown"
+        # Only writers lock; if two threads raced, keep the first answer
+        with _sid_cache_lock:
+            owner = _sid_cache.setdefault(sid_string, owner)
+    return owner
+
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
 
 def convert_size(size_bytes):
     """Convert bytes to human-readable format."""
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
-    size_name = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
-    i = int(math.log(size_bytes, 1024)) if size_bytes > 0 else 0
-    p = math.pow(1024, i)
-    s = round(size_bytes / p, 2)
-    return f"{s} {size_name[i]}"
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    i = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    s = round(size_bytes / (1 << (10 * i)), 2)
+    return f"{s} {SIZE_UNITS[i]}"
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+    
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                      wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    _kernel32.CreateFileW.restype = wintypes.HANDLE
+    _kernel32.GetFileInformationByHandleEx.argtypes = [wintypes.HANDLE, ctypes.c_int, wintypes.LPVOID, wintypes.DWORD]
+    _kernel32.GetFileInformationByHandleEx.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    
+    _FILE_LIST_DIRECTORY = 0x0001
+    _FILE_SHARE_ALL = 0x0001 | 0x0002 | 0x0004  # READ | WRITE | DELETE
+    _OPEN_EXISTING = 3
+    _FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+    _INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+    _FILE_ID_BOTH_DIRECTORY_INFO = 10
+    _ERROR_NO_MORE_FILES = 18
+    _FILE_ATTRIBUTE_DIRECTORY = 0x10
+    _IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+    _IO_REPARSE_TAG_SYMLINK = 0xA000000C
+    
+    # FILE_ID_BOTH_DIR_INFO: NextEntryOffset, FileIndex, Creation/LastAccess/
+    # LastWrite/Change times, EndOfFile, AllocationSize, FileAttributes,
+    # FileNameLength, EaSize (the reparse tag for reparse points); FileName
+    # starts at byte 104.
+    _DIR_INFO_HEADER = struct.Struct("<IIqqqqqqIII")
+    _DIR_INFO_NAME_OFFSET = 104
+    _DIR_INFO_BUFFER_SIZE = 64 * 1024
+    
+    # FILETIME counts 100ns ticks since 1601-01-01
+    _EPOCH_AS_FILETIME = 116444736000000000
+    
+    # Reparse points that link elsewhere. Other tags, such as OneDrive or
+    # dedup placeholders, are real files and are counted.
+    _LINK_REPARSE_TAGS = frozenset({_IO_REPARSE_TAG_SYMLINK, _IO_REPARSE_TAG_MOUNT_POINT})
+    
+    class _DirInfoEntry:
+        """DirEntry-like record built from one FILE_ID_BOTH_DIR_INFO record."""
+        __slots__ = ("name", "path", "_is_dir", "_is_link", "_stat")
+        
+        def __init__(self, name, path, is_dir, is_link, stat_result):
+            self.name = name
+            self.path = path
+            self._is_dir = is_dir
+            self._is_link = is_link
+            self._stat = stat_result
+        
+        def is_dir(self, follow_symlinks=True):
+            return self._is_dir
+        
+        def is_file(self, follow_symlinks=True):
+            # Like os.DirEntry, a file symlink is not a file unless followed;
+            # the target is not known here, so following is not supported
+            if self._is_link and not follow_symlinks:
+                return False
+            return not self._is_dir
+        
+        def stat(self, follow_symlinks=True):
+            return self._stat
+    
+    def list_directory(path):
+        """
+        List a directory with GetFileInformationByHandleEx.
+        
+        Each call fills a 64 KiB buffer with many FILE_ID_BOTH_DIR_INFO records,
+        which carry size, times and attributes, so listing a directory needs a
+        handful of calls rather than one per entry.
+        """
+        handle = _kernel32.CreateFileW(long_path(path), _FILE_LIST_DIRECTORY, _FILE_SHARE_ALL, None,
+                                       _OPEN_EXISTING, _FILE_FLAG_BACKUP_SEMANTICS, None)
+        if handle is None or handle == _INVALID_HANDLE_VALUE:
+            raise ctypes.WinError(ctypes.get_last_error())
+        
+        entries = []
+        buf = ctypes.create_string_buffer(_DIR_INFO_BUFFER_SIZE)
+        view = memoryview(buf)
+        try:
+            while True:
+                if not _kernel32.GetFileInformationByHandleEx(handle, _FILE_ID_BOTH_DIRECTORY_INFO,
+                                                              buf, _DIR_INFO_BUFFER_SIZE):
+                    error = ctypes.get_last_error()
+                    if error == _ERROR_NO_MORE_FILES:
+                        break
+                    raise ctypes.WinError(error)
+                
+                offset = 0
+                while True:
+                    (next_offset, _, ctime, atime, mtime, _, size, _,
+                     attributes, name_length, reparse_tag) = _DIR_INFO_HEADER.unpack_from(buf, offset)
+                    name_start = offset + _DIR_INFO_NAME_OFFSET
+                    # surrogatepass keeps names with unpaired surrogates, which NTFS allows
+                    name = view[name_start:name_start + name_length].tobytes().decode("utf-16-le", "surrogatepass")
+                    
+                    if name not in (".", ".."):
+                        is_dir = bool(attributes & _FILE_ATTRIBUTE_DIRECTORY)
+                        is_link = (bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+                                   and reparse_tag in _LINK_REPARSE_TAGS)
+                        mode = (stat.S_IFDIR | 0o777) if is_dir else (stat.S_IFREG | 0o666)
+                        stat_result = os.stat_result(
+                            (mode, 0, 0, 0, 0, 0, size,
+                             (atime - _EPOCH_AS_FILETIME) / 1e7,
+                             (mtime - _EPOCH_AS_FILETIME) / 1e7,
+                             (ctime - _EPOCH_AS_FILETIME) / 1e7),
+                            {"st_file_attributes": attributes}
+                        )
+                        entries.append(_DirInfoEntry(name, os.path.join(path, name), is_dir, is_link, stat_result))
+                    
+                    if next_offset == 0:
+                        break
+                    offset += next_offset
+        finally:
+            _kernel32.CloseHandle(handle)
+        
+        return entries
+else:
+    def list_directory(path):
+        """List a directory with os.scandir; DirEntry caches type and stat info."""
+        with os.scandir(path) as items:
+            return list(items)
+
+@dataclass
+class DirNode:
+    """
+    A scanned directory.
+    
+    Its files are stored column-wise, one list or array per field, instead of
+    one dict per file. JSON is only produced when writing output.
+    """
+    name: str
+    path: str
+    owner: str = None
+    mtime: float = None
+    atime: float = None
+    size: int = 0
+    error: str = None
+    names: list = field(default_factory=list)
+    sizes: array.array = field(default_factory=lambda: array.array('q'))
+    owners: list = field(default_factory=list)
+    mtimes: array.array = field(default_factory=lambda: array.array('d'))
+    atimes: array.array = field(default_factory=lambda: array.array('d'))
+    children: list = field(default_factory=list)
+    
+    def add_file(self, name, size, mtime, atime):
+        """Append one file's metadata to the columns; owners are filled in later."""
+        self.names.append(name)
+        self.sizes.append(size)
+        self.owners.append(None)
+        self.mtimes.append(mtime)
+        self.atimes.append(atime)
+    
+    def take_contents(self, other):
+        """Move the files, sub-directories, size and error of a scanned copy into this node."""
+        self.names = other.names
+        self.sizes = other.sizes
+        self.owners = other.owners
+        self.mtimes = other.mtimes
+        self.atimes = other.atimes
+        self.children = other.children
+        self.size = other.size
+        self.error = other.error
+    
+    def owner_entries(self, limit=None):
+        """
+        Pick the entries whose owners are worth looking up.
+        
+        Entries are numbered files first, then sub-directories. Sub-directory
+        sizes must be complete, since with a limit only the largest entries
+        are picked.
+        
+        Args:
+            limit: Maximum number of entries, or None for all of them
+        """
+        count = len(self.names) + len(self.children)
+        if limit is None or count <= limit:
+            return range(count)
+        sizes = self.sizes.tolist() + [child.size for child in self.children]
+        return heapq.nlargest(limit, range(count), key=sizes.__getitem__)
+    
+    def owner_paths(self, entries):
+        """Paths of the entries picked by owner_entries."""
+        file_count = len(self.names)
+        return [os.path.join(self.path, self.names[i]) if i < file_count else self.children[i - file_count].path
+                for i in entries]
+    
+    def assign_owners(self, entries, owners):
+        """Store the owner names looked up for owner_paths(entries)."""
+        file_count = len(self.names)
+        for i, owner in zip(entries, owners):
+            if i < file_count:
+                self.owners[i] = owner
+            else:
+                self.children[i - file_count].owner = owner
 
-def scan_directory_fast(start_path, verbose=True, max_workers=16, max_depth=None):
+# Skip these system directories, wherever they appear. Names are lowercase
+# because Windows file names are case-insensitive.
+SKIP_DIRS = frozenset({
+    "$recycle.bin",
+    "system volume information",
+    "documents and settings",  # Windows Vista+ junction
+    "recovery",                # Windows recovery partition
+    "config.msi",              # Windows installer files
+    "$sysreset",               # Windows reset files
+    "$windows.~bt",            # Windows upgrade files
+    "$windows.~ws",            # Windows upgrade files
+    "windowsapps",             # Windows store apps
+    "winsxs",                  # Windows component store (huge)
+    "perflogs"                 # Performance logs
+})
+
+# System files that only live at the root of a drive
+SKIP_ROOT_FILES = frozenset({
+    "pagefile.sys",
+    "swapfile.sys",
+    "hiberfil.sys"
+})
+
+def is_drive_root(path):
     """
-    Optimized directory scanning using producer-consumer pattern with threading.
+    Check whether path is the root of a drive or share, e.g. C:\\ or \\\\server\\share\\.
+    
+    Drive-level system files and $-prefixed directories are only skipped
+    there, not at the root of any scan.
+    """
+    path = os.path.abspath(path)
+    if path.startswith("\\\\?\\UNC\\"):
+        path = "\\\\" + path[8:]
+    elif path.startswith("\\\\?\\"):
+        path = path[4:]
+    return os.path.dirname(path) == path
+
+def scan_one_directory(path, at_root=False):
+    """
+    List one directory and collect its files and sub-directories.
+    
+    Runs in a worker thread or process, so it touches no shared state;
+    sub-directories come back as unscanned child nodes and the counters are
+    returned for the caller to aggregate. Owners are looked up separately
+    by lookup_owner_sids so listing is not held up by security descriptor reads.
+    
+    Args:
+        path: Directory to list
+        at_root: path is the root of a drive, where drive-level system files
+            and $-prefixed system directories are skipped as well
+    
+    Returns:
+        (node, counters) where counters is (files, dirs, bytes, errors)
+    """
+    node = DirNode(name=os.path.basename(path) or path, path=path)
+    files = dirs = total_bytes = errors = 0
+    
+    try:
+        # Entries come with type and stat info from the directory read,
+        # so no per-item access/stat probes are needed
+        for item in list_directory(path):
+            try:
+                # Process based on file type. File symlinks are not files here,
+                # and directory symlinks and junctions are skipped below, so
+                # links are never followed or counted. Names such as
+                # node_modules or index.js repeat across a tree, so they are
+                # interned.
+                if item.is_file(follow_symlinks=False):
+                    if at_root and item.name.lower() in SKIP_ROOT_FILES:
+                        continue
+                    st = item.stat(follow_symlinks=False)
+                    node.add_file(sys.intern(item.name), st.st_size, st.st_mtime, st.st_atime)
+                    files += 1
+                    total_bytes += st.st_size
+                elif item.is_dir(follow_symlinks=False):
+                    # Skip system directories, including unlisted $-prefixed
+                    # ones such as $WinREAgent at the root of a drive
+                    if item.name.lower() in SKIP_DIRS or (at_root and item.name.startswith("$")):
+                        continue
+                    st = item.stat(follow_symlinks=False)
+                    # Don't descend into junctions or directory symlinks (e.g.
+                    # C:\Users\All Users); they double-count or loop forever.
+                    # The attributes come with the listing, so this is free.
+                    if getattr(st, "st_file_attributes", 0) & stat.FILE_ATTRIBUTE_REPARSE_POINT:
+                        continue
+                    # For directories, add a child node to be scanned later
+                    node.children.append(DirNode(name=sys.intern(item.name), path=item.path,
+                                                 mtime=st.st_mtime, atime=st.st_atime))
+                    dirs += 1
+            except Exception as e:
+                # Skip items we can't access
+                errors += 1
+    
+    except Exception as e:
+        node.error = str(e)
+        errors += 1
+    
+    # Own files only; sub-directory sizes are added as each sub-directory completes
+    node.size = total_bytes
+    return node, (files, dirs, total_bytes, errors)
+
+def owner_name(sid_string):
+    """Account name for an owner SID string from get_owner_sid (None if unreadable)."""
+    if sid_string is None:
+        return "Unknown"
+    return get_account_name(sid_string)
+
+def lookup_owner_sids(paths):
+    """Look up the owner SID of each path; runs as its own worker task."""
+    return [get_owner_sid(path) for path in paths]
+
+# Scan workers by drive type. The work is I/O bound, so the useful number of
+# listings in flight depends on the device, not the CPU: SSDs want a deep
+# queue, USB sticks and spinning disks thrash on seeks, and network shares
+# need many requests outstanding to hide round-trip latency.
+DRIVE_WORKERS = {
+    win32file.DRIVE_FIXED: 16,
+    win32file.DRIVE_REMOTE: 64,
+    win32file.DRIVE_REMOVABLE: 4,
+}
+DEFAULT_WORKERS = 16
+
+def default_worker_count(path):
+    """
+    Pick a scan worker count suited to the drive holding path.
+    
+    Args:
+        path: Path being scanned
+    
+    Returns:
+        Number of workers from DRIVE_WORKERS, or DEFAULT_WORKERS if the drive type is unknown
+    """
+    drive = os.path.splitdrive(os.path.abspath(path))[0]
+    if not drive:
+        return DEFAULT_WORKERS
+    try:
+        drive_type = win32file.GetDriveType(drive + "\\")
+    except Exception:
+        return DEFAULT_WORKERS
+    return DRIVE_WORKERS.get(drive_type, DEFAULT_WORKERS)
+
+def scan_directory_fast(start_path, verbose=True, max_workers=None, max_depth=None, use_processes=False,
+                        owner_limit=50):
+    """
+    Optimized directory scanning with one task per directory on a shared worker pool.
     
     Args:
         start_path: Path to scan
         verbose: Whether to show progress
-        max_workers: Maximum number of concurrent workers
+        max_workers: Maximum number of concurrent workers (None picks one for the drive type)
         max_depth: Maximum directory depth to scan (None for unlimited)
+        use_processes: Scan in worker processes instead of threads
+        owner_limit: Look up owners only for this many of the largest entries
+            in each directory (None for all); the rest are left as None
     """
     start_time = time.time()
-    
-    # Skip these system directories
-    skip_dirs = {
-        "$RECYCLE.BIN", 
-        "System Volume Information", 
-        "pagefile.sys", 
-        "swapfile.sys",
-        "hiberfil.sys",
-        "Documents and Settings",  # Windows Vista+ junction
-        "Recovery",                # Windows recovery partition
-        "Config.Msi",              # Windows installer files
-        "$SysReset",               # Windows reset files
-        "$Windows.~BT",            # Windows upgrade files
-        "$Windows.~WS",            # Windows upgrade files
-        "WindowsApps",             # Windows store apps
-        "WinSxS",                  # Windows component store (huge)
-        "PerfLogs"                 # Performance logs
-    }
+    if max_workers is None:
+        max_workers = default_worker_count(start_path)
     
     # Stats counters
     stats = {
@@ -85,227 +443,180 @@ def scan_directory_fast(start_path, verbose=True, max_workers=16, max_depth=None
     # Create thread-safe counters
     stats_lock = threading.Lock()
     
-    # Store path metadata (to avoid recalculating)
-    metadata_cache = {}
-    metadata_lock = threading.Lock()
+    # Win32 calls take the \\?\ form of paths (see long_path), which must be
+    # absolute and use backslashes only
+    if os.name == "nt":
+        start_path = os.path.abspath(start_path)
     
-    def get_cached_metadata(path, is_file=None):
-        """Get metadata for a path, using cache if available."""
-        with metadata_lock:
-            if path in metadata_cache:
-                return metadata_cache[path]
-        
-        if is_file is None:
-            is_file = os.path.isfile(path)
-        
-        try:
-            # For files, get full metadata
-            if is_file:
-                size = os.path.getsize(path)
-                with stats_lock:
-                    stats["files_processed"] += 1
-                    stats["bytes_counted"] += size
-                
-                result = {
-                    "name": os.path.basename(path),
-                    "path": path,
-                    "size": size,
-                    "human_size": convert_size(size),
-                    "type": "file",
-                    "owner": get_file_owner(path),
-                    "modified": get_file_stats(path)["modified"],
-                    "accessed": get_file_stats(path)["accessed"]
-                }
-            # For directories, just placeholder data until we process its contents
-            else:
-                with stats_lock:
-                    stats["dirs_processed"] += 1
-                    
-                result = {
-                    "name": os.path.basename(path) or path,
-                    "path": path,
-                    "children": [],
-                    "size": 0,
-                    "type": "directory",
-                    "owner": get_file_owner(path),
-                    "modified": get_file_stats(path)["modified"],
-                    "accessed": get_file_stats(path)["accessed"]
-                }
-        except Exception as e:
-            with stats_lock:
-                stats["errors_encountered"] += 1
-            result = {
-                "name": os.path.basename(path),
-                "path": path,
-                "size": 0,
-                "human_size": "0 B",
-                "type": "error",
-                "error": str(e)
-            }
-        
-        # Cache the result
-        with metadata_lock:
-            metadata_cache[path] = result
-        
-        return result
-    
-    # Directory structure will be built bottom-up
-    dir_structure = {}
-    dir_lock = threading.Lock()
+    # Drive-level system entries are only skipped when scanning a whole drive
+    at_drive_root = is_drive_root(start_path)
     
-    # Queue for directories to process
-    dir_queue = queue.Queue()
-    
-    # Add the start path to the queue
-    base_name = os.path.basename(start_path) or start_path
-    dir_queue.put((start_path, 0))  # (path, depth)
+    # Root of the tree; every other directory is created by its parent's scan
+    root = DirNode(name=os.path.basename(start_path) or start_path, path=start_path)
+    try:
+        st = os.stat(start_path)
+        root.owner = get_owner_sid(start_path)
+        root.mtime = st.st_mtime
+        root.atime = st.st_atime
+        stats["dirs_processed"] += 1
+    except Exception as e:
+        root.error = str(e)
+        stats["errors_encountered"] += 1
     
     # Start the status update thread if verbose mode is on
     stop_status_thread = threading.Event()
     
     def status_update_thread():
         """Thread to periodically display status updates."""
-        while not stop_status_thread.is_set():
-            with stats_lock:
-                current_stats = dict(stats)
-            
+        # The counters are plain ints, so reading them without the lock is
+        # safe; a line that mixes two updates is fine for a progress display
+        while True:
             elapsed = time.time() - start_time
-            print(f"\rProcessed: {current_stats['dirs_processed']} dirs, "
-                  f"{current_stats['files_processed']} files, "
-                  f"{convert_size(current_stats['bytes_counted'])} in {elapsed:.1f}s", end="")
+            print(f"\rProcessed: {stats['dirs_processed']} dirs, "
+                  f"{stats['files_processed']} files, "
+                  f"{convert_size(stats['bytes_counted'])} in {elapsed:.1f}s", end="")
             
-            time.sleep(0.5)
+            # Waiting on the event lets a stop request end the thread at once
+            if stop_status_thread.wait(0.25):
+                break
     
     if verbose:
         status_thread = threading.Thread(target=status_update_thread)
         status_thread.daemon = True
         status_thread.start()
     
-    # Worker function to process directories
-    def process_directory():
-        while True:
-            try:
-                # Get a directory from the queue
-                dir_path, depth = dir_queue.get(timeout=1)
-                
-                # Stop if we've reached max depth
-                if max_depth is not None and depth > max_depth:
-                    dir_queue.task_done()
-                    continue
+    def walk_directory():
+        """
+        Scan the tree depth-first on the calling thread.
+        
+        Each directory is finished as the walk leaves it: its size includes
+        all of its sub-directories and owner names are filled in. The walk
+        keeps its own stack of (node, depth, remaining children) so deep
+        trees can't hit Python's recursion limit.
+        """
+        stack = [(root, 0, None)]
+        while stack:
+            node, depth, children = stack[-1]
+            if children is None:
+                scanned, (files, dirs, total_bytes, errors) = scan_one_directory(node.path, depth == 0 and at_drive_root)
+                node.take_contents(scanned)
                 
-                # Get directory metadata
-                dir_data = get_cached_metadata(dir_path, is_file=False)
+                # Only this thread writes the counters; the reporter just reads them
+                stats["files_processed"] += files
+                stats["dirs_processed"] += dirs
+                stats["bytes_counted"] += total_bytes
+                stats["errors_encountered"] += errors
                 
-                # Skip if there was an error
-                if dir_data.get("type") == "error":
-                    dir_queue.task_done()
-                    continue
+                # Stop if we've reached max depth
+                if max_depth is None or depth + 1 <= max_depth:
+                    children = iter(node.children)
+                else:
+                    children = iter(())
+                stack[-1] = (node, depth, children)
+            
+            child = next(children, None)
+            if child is not None:
+                stack.append((child, depth + 1, None))
+                continue
+            
+            stack.pop()
+            entries = node.owner_entries(owner_limit)
+            node.assign_owners(entries, [owner_name(sid) for sid in lookup_owner_sids(node.owner_paths(entries))])
+            if stack:
+                stack[-1][0].size += node.size
+    
+    def scan_with_pool():
+        """Scan the tree with one task per directory on a worker pool."""
+        # Every directory is a task on one shared pool, so a single large
+        # subtree is spread over all workers. Tasks never wait on each other:
+        # the main thread grafts each result into the tree, adds its counters
+        # and submits the sub-directories it found. Owner SID lookups for a
+        # directory's entries go in as a separate task once its subtree is
+        # complete, queued behind the pending listings, so directory reads keep
+        # running ahead of the slower security descriptor reads. Worker
+        # processes bypass the GIL for the Python-side per-entry work.
+        if use_processes:
+            num_workers = min(max_workers, os.cpu_count())
+            if os.name == "nt":
+                # WaitForMultipleObjects limits Windows process pools to 61 workers
+                num_workers = min(num_workers, 61)
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"))
+        else:
+            num_workers = max_workers
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_workers)
+        
+        # Sizes roll up as the scan goes: a directory is complete once its own
+        # listing and every sub-directory it queued are complete, and then its
+        # size is added to its parent. unfinished maps id(node) to the number
+        # of queued sub-directories that are not complete yet.
+        unfinished = {}
+        scans = {}
+        owner_lookups = {}
+        
+        def complete_directory(node, parent):
+            while True:
+                # All entry sizes are final now, so the largest can be picked
+                # for owner lookups
+                entries = node.owner_entries(owner_limit)
+                if entries:
+                    owner_lookups[executor.submit(lookup_owner_sids, node.owner_paths(entries))] = (node, entries)
                 
-                try:
-                    # Scan the directory
-                    items = os.scandir(dir_path)
-                    children_data = []
+                if parent is None:
+                    return
+                parent_node, grandparent = parent
+                parent_node.size += node.size
+                unfinished[id(parent_node)] -= 1
+                if unfinished[id(parent_node)]:
+                    return
+                del unfinished[id(parent_node)]
+                node, parent = parent_node, grandparent
+        
+        with executor:
+            if root.error is None:
+                scans[executor.submit(scan_one_directory, root.path, at_drive_root)] = (root, 0, None)
+            while scans or owner_lookups:
+                done, _ = concurrent.futures.wait(list(scans) + list(owner_lookups),
+                                                  return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in owner_lookups:
+                        # Names come from the SID cache, so each distinct
+                        # owner is looked up once, in this process
+                        node, entries = owner_lookups.pop(future)
+                        node.assign_owners(entries, [owner_name(sid) for sid in future.result()])
+                        continue
                     
-                    # Process each item in the directory
-                    for item in items:
-                        item_path = item.path
-                        
-                        # Skip system directories
-                        if item.name in skip_dirs:
-                            continue
-                        
-                        try:
-                            # First check if we can access it
-                            if not os.access(item_path, os.R_OK):
-                                continue
-                            
-                            # Process based on file type
-                            if item.is_file():
-                                # For files, just get metadata
-                                file_data = get_cached_metadata(item_path, is_file=True)
-                                children_data.append(file_data)
-                            elif item.is_dir():
-                                # For directories, add to queue and create placeholder
-                                dir_queue.put((item_path, depth + 1))
-                                # Also create an entry in the directory structure
-                                with dir_lock:
-                                    dir_structure[item_path] = []
-                                children_data.append(get_cached_metadata(item_path, is_file=False))
-                        except Exception as e:
-                            with stats_lock:
-                                stats["errors_encountered"] += 1
-                            # Skip items we can't access
-                            continue
+                    node, depth, parent = scans.pop(future)
+                    scanned, (files, dirs, total_bytes, errors) = future.result()
+                    node.take_contents(scanned)
                     
-                    # Store children list in directory structure
-                    with dir_lock:
-                        dir_structure[dir_path] = children_data
-                
-                except Exception as e:
                     with stats_lock:
-                        stats["errors_encountered"] += 1
-                
-                dir_queue.task_done()
-                
-            except queue.Empty:
-                # Queue is empty, check if we're done
-                if dir_queue.unfinished_tasks == 0:
-                    break
-    
-    # Create and start worker threads
-    workers = []
-    for _ in range(min(max_workers, os.cpu_count() * 2)):
-        thread = threading.Thread(target=process_directory)
-        thread.daemon = True
-        thread.start()
-        workers.append(thread)
-    
-    # Wait for all directories to be processed
-    dir_queue.join()
+                        stats["files_processed"] += files
+                        stats["dirs_processed"] += dirs
+                        stats["bytes_counted"] += total_bytes
+                        stats["errors_encountered"] += errors
+                    
+                    # Stop if we've reached max depth
+                    if node.children and (max_depth is None or depth + 1 <= max_depth):
+                        unfinished[id(node)] = len(node.children)
+                        for child in node.children:
+                            scans[executor.submit(scan_one_directory, child.path)] = (child, depth + 1, (node, parent))
+                    else:
+                        complete_directory(node, parent)
     
-    # Stop workers
-    for worker in workers:
-        worker.join(0.1)
+    root.owner = owner_name(root.owner)
+    if max_workers <= 1 and not use_processes:
+        # A single worker gains nothing from a pool; walk inline, which
+        # needs no locks and no task bookkeeping
+        if root.error is None:
+            walk_directory()
+    else:
+        scan_with_pool()
     
     if verbose:
         stop_status_thread.set()
-        if status_thread.is_alive():
-            status_thread.join(0.1)
-    
-    # Post-process to calculate sizes
-    def finalize_directory_data(path):
-        """Calculate sizes for directories and prepare final structure."""
-        # Check if we have info for this path
-        if path not in dir_structure:
-            # This is either a file or an empty/unreadable directory
-            return get_cached_metadata(path)
-        
-        # Get children data
-        children = dir_structure[path]
-        
-        # Process each child
-        for i, child in enumerate(children):
-            if child["type"] == "directory":
-                # Recursively finalize child directories
-                child_data = finalize_directory_data(child["path"])
-                children[i] = child_data
-        
-        # Calculate directory size
-        total_size = sum(child["size"] for child in children)
-        
-        # Update directory metadata
-        dir_data = get_cached_metadata(path, is_file=False)
-        dir_data["children"] = sorted(children, key=lambda x: x["size"], reverse=True)
-        dir_data["size"] = total_size
-        dir_data["human_size"] = convert_size(total_size)
-        
-        return dir_data
-    
-    # Build final tree from the root
-    if verbose:
-        print("\nFinalizing directory structure...")
-    
-    result = finalize_directory_data(start_path)
+        status_thread.join()
+        print()
     
     # Print final statistics
     if verbose:
@@ -315,11 +626,9 @@ def scan_directory_fast(start_path, verbose=True, max_workers=16, max_depth=None
         print(f"Total size: {convert_size(stats['bytes_counted'])} ({stats['bytes_counted']} bytes)")
         print(f"Errors encountered: {stats['errors_encountered']}")
     
-    return result
+    return root
 
-def create_html_visualization(data, output_file="disk_visualization.html"):
-    """Create HTML file with the visualization."""
-    html_content = """
+HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -510,7 +819,56 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
 
         <script>
             // Load the data
-            const data = DATA_PLACEHOLDER;
+            const data = hydrate(DATA_PLACEHOLDER);
+            
+            // The tree is shipped as positional arrays so keys are not repeated
+            // for every entry: [name, size, owner, mtime, atime] for a file, the
+            // same plus a children array (and an error, if any) for a folder,
+            // and [name, size] for a folded "other" entry. Paths are rebuilt
+            // from the root path and the names, the way os.path.join builds them.
+            function hydrate(packed) {
+                const sep = packed.sep;
+                const bare = sep === "\\\\" ? /[\\\\/:]$/ : /\\/$/;
+                function unpack(a, path) {
+                    const node = {name: a[0], path: path, size: a[1], owner: null, mtime: null, atime: null};
+                    if (a.length === 2) {
+                        node.type = "other";
+                        return node;
+                    }
+                    node.owner = a[2];
+                    node.mtime = a[3];
+                    node.atime = a[4];
+                    if (a.length === 5) {
+                        node.type = "file";
+                        return node;
+                    }
+                    node.type = "directory";
+                    if (a.length > 6) node.error = a[6];
+                    const prefix = bare.test(path) ? path : path + sep;
+                    node.children = a[5].map(c => unpack(c, c.length === 2 ? path : prefix + c[0]));
+                    return node;
+                }
+                return unpack(packed.tree, packed.path);
+            }
+            
+            // Port of convert_size(): sizes are shipped as bytes only
+            const sizeUnits = ["B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"];
+            function convertSize(bytes) {
+                if (!bytes || bytes <= 0) return "0 B";
+                let i = Math.min(Math.floor(Math.log2(bytes) / 10), sizeUnits.length - 1);
+                // log2 can round up just below a unit boundary
+                if (i > 0 && bytes < Math.pow(1024, i)) i--;
+                return `${Math.round(bytes / Math.pow(1024, i) * 100) / 100} ${sizeUnits[i]}`;
+            }
+            
+            // Timestamps are shipped as POSIX seconds and shown in local time
+            function formatTime(t) {
+                if (t === null || t === undefined) return "Unknown";
+                const date = new Date(t * 1000);
+                const pad = n => String(n).padStart(2, "0");
+                return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())} ` +
+                       `${pad(date.getHours())}:${pad(date.getMinutes())}:${pad(date.getSeconds())}`;
+            }
             
             // Set up dimensions
             const width = Math.min(window.innerWidth, window.innerHeight) * 0.85;
@@ -536,9 +894,8 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                 .attr("class", "tooltip")
                 .style("opacity", 0);
             
-            // Create partition layout
-            const partition = d3.partition()
-                .size([2 * Math.PI, radius]);
+            // Create partition layout; its size depends on the layout chosen below
+            const partition = d3.partition();
             
             // Create arc generator
             const arc = d3.arc()
@@ -547,19 +904,71 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                 .innerRadius(d => Math.sqrt(d.y0))
                 .outerRadius(d => Math.sqrt(d.y1))
                 .padAngle(0.002)  // Add small padding between arcs
-                .padRadius(radius / 2);
+                .padRadius(radius / 2)
+                // Path data in full float precision is long to build and parse;
+                // two decimals is well under a pixel even with the scale(10) transform
+                .digits(2);
+            
+            // Rectangle path for a node in the icicle layout. Depth 1 starts at
+            // the top, since the root's own band is never drawn.
+            function icicleRect(d) {
+                const y0 = d.y0 - root.y1;
+                const y1 = d.y1 - root.y1;
+                return `M${d.x0.toFixed(2)},${y0.toFixed(2)}H${d.x1.toFixed(2)}V${y1.toFixed(2)}H${d.x0.toFixed(2)}Z`;
+            }
+            
+            // Build the size-sorted hierarchy for a data tree; partition() lays it out.
+            // Each node gets an id so arcs can be keyed across re-renders, and
+            // its fill (the colour of its top-level ancestor) and opacity, so
+            // drawing an arc only reads properties.
+            function buildHierarchy(treeData) {
+                const hierarchy = d3.hierarchy(treeData);
+                let nextId = 0;
+                // each() is breadth-first, so a parent's fill is set before its
+                // children's, and sorting the children here orders them before
+                // they are visited. Folder sizes are already cumulative, so the
+                // value is the size itself rather than a sum() over the tree.
+                hierarchy.each(d => {
+                    d.value = d.data.size;
+                    if (d.children) {
+                        d.children.sort((a, b) => b.data.size - a.data.size);
+                    }
+                    d.id = nextId++;
+                    d.fill = d.depth === 0 ? null : d.depth === 1 ? colorScale(d.data.name) : d.parent.fill;
+                    d.fillOpacity = 1 - d.depth * 0.1;
+                });
+                hierarchy.nodeCount = nextId;
+                return hierarchy;
+            }
             
             // Create hierarchy from data
-            const root = d3.hierarchy(data)
-                .sum(d => d.size)
-                .sort((a, b) => b.value - a.value);
+            let root = buildHierarchy(data);
             
-            // Apply partition layout
+            // Large trees are drawn as an icicle: rectangles need no trigonometry
+            // and give short path data, so zooming stays responsive. The layout
+            // is chosen once from the full tree and kept when re-rooting.
+            const ICICLE_THRESHOLD = 20000;
+            const icicle = root.nodeCount > ICICLE_THRESHOLD;
+            const shape = icicle ? icicleRect : arc;
+            partition.size(icicle ? [width, height] : [2 * Math.PI, radius]);
             partition(root);
+            if (icicle) {
+                // Rectangles use plain chart coordinates
+                svg.attr("transform", null);
+            }
+            
+            // Beyond this many nodes the chart is painted on a canvas: one
+            // bitmap instead of an element per arc, with clicks and hovers
+            // mapped back to nodes through the layout
+            const CANVAS_THRESHOLD = 100000;
+            const useCanvas = root.nodeCount > CANVAS_THRESHOLD;
             
             // Current view state
             let currentNode = root;
             
+            // Arcs go in their own group so they stay below the centre circle and label
+            const arcLayer = svg.append("g");
+            
             // Add center circle (scaled down to match the scale(10) transform)
             svg.append("circle")
                 .attr("fill", "white")
@@ -567,36 +976,189 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                 .attr("stroke", "#ddd")
                 .attr("stroke-width", 0.1)  // 10x smaller due to scale(10)
                 .style("cursor", "pointer")
+                .style("display", icicle ? "none" : null)
                 .on("click", () => {
                     if (currentNode.parent) {
                         update(currentNode.parent);
                     }
                 });
             
-            // Create paths for all nodes
-            const path = svg.selectAll("path")
-                .data(root.descendants().slice(1))
-                .enter().append("path")
-                .attr("fill", d => {
-                    while (d.depth > 1) d = d.parent;
-                    return colorScale(d.data.name);
-                })
-                .attr("fill-opacity", d => 1 - d.depth * 0.1)
-                .attr("d", arc)
-                .on("click", (event, d) => {
+            // Elements updated on every zoom are selected once here
+            const centerLabel = svg.append("text")
+                .attr("class", "center-label")
+                .attr("dy", "0.35em")
+                .attr("transform", "scale(0.1)")  // Scale the text to be readable
+                .style("display", icicle ? "none" : null)
+                .on("click", () => {
+                    if (currentNode !== root && currentNode.parent) {
+                        update(currentNode.parent);
+                    }
+                });
+            const detailContent = document.getElementById("detail-content");
+            const breadcrumb = d3.select(".breadcrumb");
+            const legend = d3.select("#legend");
+            const resetButton = document.querySelector(".reset-button");
+            
+            // The canvas sits under the SVG, which keeps only the centre circle
+            // and label clickable
+            let canvas = null;
+            let context = null;
+            if (useCanvas) {
+                const container = document.getElementById("chart-container");
+                const svgElement = container.querySelector("svg");
+                const ratio = window.devicePixelRatio || 1;
+                const canvasElement = document.createElement("canvas");
+                canvasElement.width = width * ratio;
+                canvasElement.height = height * ratio;
+                // object-fit mirrors the SVG viewBox letterboxing
+                canvasElement.style.cssText = "position: absolute; width: 100%; height: 100%; object-fit: contain;";
+                container.style.position = "relative";
+                container.insertBefore(canvasElement, svgElement);
+                svgElement.style.position = "absolute";
+                svgElement.style.pointerEvents = "none";
+                svg.select("circle").style("pointer-events", "visiblePainted");
+                centerLabel.style("pointer-events", "visiblePainted");
+                canvas = d3.select(canvasElement);
+                context = canvasElement.getContext("2d");
+                if (!icicle) {
+                    arc.context(context);
+                }
+            }
+            
+            // Nodes drawn while zoomed to a node: every ring from the centre
+            // out to it, plus two rings of its descendants. Deeper rings are
+            // only created when the user zooms in, so the number of <path>
+            // elements follows what is on screen, not the size of the scan.
+            function visibleNodes(node) {
+                const nodes = [];
+                node.ancestors().forEach(ancestor => {
+                    if (ancestor.parent) {
+                        ancestor.parent.children.forEach(d => nodes.push(d));
+                    }
+                });
+                (node.children || []).forEach(child => {
+                    nodes.push(child);
+                    (child.children || []).forEach(d => nodes.push(d));
+                });
+                return nodes;
+            }
+            
+            // Paths for the visible nodes; arcs that are still visible are kept,
+            // new ones are appended and ones that went out of view are removed
+            let path = arcLayer.selectAll("path");
+            
+            // Per-arc accessors are defined once rather than as fresh closures
+            // on every render, so each call site always sees the same function
+            function arcKey(d) { return d.id; }
+            function arcFill(d) { return d.fill; }
+            function arcFillOpacity(d) { return d.fillOpacity; }
+            function arcPointerEvents(d) { return d.inFocus ? "auto" : "none"; }
+            function arcOpacity(d) { return d.inFocus ? 1 : 0.3; }
+            function enterArcs(enter) {
+                return enter.append("path")
+                    .attr("fill", arcFill)
+                    .attr("fill-opacity", arcFillOpacity)
+                    .attr("d", shape);
+            }
+            
+            let visible = [];
+            let visibleSet = new Set();
+            
+            function renderArcs(node) {
+                visible = visibleNodes(node);
+                if (useCanvas) {
+                    // Drawn by drawCanvas once focus is known
+                    visibleSet = new Set(visible);
+                    return;
+                }
+                path = path
+                    .data(visible, arcKey)
+                    .join(enterArcs);
+            }
+            
+            // Paint the visible nodes; arcs out of focus are dimmed as in the SVG view
+            function drawCanvas() {
+                const ratio = canvas.node().width / width;
+                context.setTransform(ratio, 0, 0, ratio, 0, 0);
+                context.clearRect(0, 0, width, height);
+                if (!icicle) {
+                    context.translate(width / 2, height / 2);
+                    context.scale(10, 10);
+                }
+                visible.forEach(d => {
+                    context.beginPath();
+                    if (icicle) {
+                        context.rect(d.x0, d.y0 - root.y1, d.x1 - d.x0, d.y1 - d.y0);
+                    } else {
+                        arc(d);
+                    }
+                    context.fillStyle = d.fill;
+                    context.globalAlpha = Math.max(0, d.fillOpacity) * (d.inFocus === false ? 0.3 : 1);
+                    context.fill();
+                });
+            }
+            
+            // Find the visible node under a mouse event. Children are laid out
+            // in order, so each level is a binary search on x0 and a hit costs
+            // O(depth * log(children)) instead of a DOM lookup.
+            function nodeAt(event) {
+                const bounds = canvas.node().getBoundingClientRect();
+                const scale = Math.min(bounds.width / width, bounds.height / height);
+                const x = (event.clientX - bounds.left - (bounds.width - width * scale) / 2) / scale;
+                const y = (event.clientY - bounds.top - (bounds.height - height * scale) / 2) / scale;
+                let along, across;
+                if (icicle) {
+                    along = x;
+                    across = y + root.y1;
+                } else {
+                    // Undo the centre translation and scale(10); radii are sqrt(y)
+                    const dx = (x - width / 2) / 10;
+                    const dy = (y - height / 2) / 10;
+                    along = Math.atan2(dx, -dy);
+                    if (along < 0) along += 2 * Math.PI;
+                    across = dx * dx + dy * dy;
+                }
+                
+                let node = root;
+                while (node.children) {
+                    const children = node.children;
+                    let lo = 0;
+                    let hi = children.length - 1;
+                    while (lo < hi) {
+                        const mid = (lo + hi + 1) >> 1;
+                        if (children[mid].x0 <= along) lo = mid; else hi = mid - 1;
+                    }
+                    const child = children[lo];
+                    if (along < child.x0 || along >= child.x1 || across < child.y0) return null;
+                    if (across < child.y1) return visibleSet.has(child) ? child : null;
+                    node = child;
+                }
+                return null;
+            }
+            
+            // One set of listeners on the arc group serves every arc; the
+            // node is read back from the data bound to the event's target
+            arcLayer
+                .on("click", event => {
+                    const d = event.target.__data__;
+                    if (!d) return;
                     update(d);
                     event.stopPropagation();
                 })
-                .on("dblclick", (event, d) => {
+                .on("dblclick", event => {
+                    const d = event.target.__data__;
+                    if (!d) return;
                     // Set as new root on double-click
                     setNewRoot(d);
                     event.stopPropagation();
                 })
-                .on("mouseover", (event, d) => {
+                .on("mouseover", event => {
+                    const d = event.target.__data__;
+                    if (!d) return;
                     tooltip.transition()
                         .duration(200)
                         .style("opacity", 0.9);
-                    tooltip.html(`${d.data.name} (${d.data.human_size})`)
+                    tooltip.html(`${d.data.name} (${convertSize(d.data.size)})`)
                         .style("left", (event.pageX + 10) + "px")
                         .style("top", (event.pageY - 28) + "px");
                 })
@@ -606,6 +1168,52 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                         .style("opacity", 0);
                 });
             
+            if (useCanvas) {
+                let hovered = null;
+                canvas
+                    .on("click", event => {
+                        const d = nodeAt(event);
+                        if (d && d.inFocus !== false) {
+                            update(d);
+                        } else if (currentNode !== root && currentNode.parent) {
+                            // Same as a background click
+                            update(currentNode.parent);
+                        }
+                    })
+                    .on("dblclick", event => {
+                        const d = nodeAt(event);
+                        if (d) {
+                            setNewRoot(d);
+                        } else {
+                            window.location.reload();
+                        }
+                    })
+                    .on("mousemove", event => {
+                        const d = nodeAt(event);
+                        if (d) {
+                            if (d !== hovered) {
+                                tooltip.transition()
+                                    .duration(200)
+                                    .style("opacity", 0.9);
+                                tooltip.html(`${d.data.name} (${convertSize(d.data.size)})`);
+                            }
+                            tooltip.style("left", (event.pageX + 10) + "px")
+                                .style("top", (event.pageY - 28) + "px");
+                        } else if (hovered) {
+                            tooltip.transition()
+                                .duration(500)
+                                .style("opacity", 0);
+                        }
+                        hovered = d;
+                    })
+                    .on("mouseleave", () => {
+                        hovered = null;
+                        tooltip.transition()
+                            .duration(500)
+                            .style("opacity", 0);
+                    });
+            }
+            
             // Function to check if a node is a descendant of another node
             function ancestors(node, target) {
                 let current = node;
@@ -618,8 +1226,6 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
             
             // Update the details panel
             function updateDetails(node) {
-                const content = document.getElementById("detail-content");
-                
                 const details = `
                     <div class="detail-row">
                         <div class="detail-label">Name:</div>
@@ -631,27 +1237,27 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                     </div>
                     <div class="detail-row">
                         <div class="detail-label">Size:</div>
-                        <div class="detail-value">${node.data.human_size} (${node.value.toLocaleString()} bytes)</div>
+                        <div class="detail-value">${convertSize(node.data.size)} (${node.value.toLocaleString()} bytes)</div>
                     </div>
                     <div class="detail-row">
                         <div class="detail-label">Type:</div>
-                        <div class="detail-value">${node.data.type === 'directory' ? 'Folder' : 'File'}</div>
+                        <div class="detail-value">${{directory: 'Folder', file: 'File', other: 'Small items'}[node.data.type]}</div>
                     </div>
                     <div class="detail-row">
                         <div class="detail-label">Owner:</div>
-                        <div class="detail-value">${node.data.owner || 'Unknown'}</div>
+                        <div class="detail-value">${node.data.owner ?? 'Not looked up'}</div>
                     </div>
                     <div class="detail-row">
                         <div class="detail-label">Last Modified:</div>
-                        <div class="detail-value">${node.data.modified || 'Unknown'}</div>
+                        <div class="detail-value">${formatTime(node.data.mtime)}</div>
                     </div>
                     <div class="detail-row">
                         <div class="detail-label">Last Accessed:</div>
-                        <div class="detail-value">${node.data.accessed || 'Unknown'}</div>
+                        <div class="detail-value">${formatTime(node.data.atime)}</div>
                     </div>
                 `;
                 
-                content.innerHTML = details;
+                detailContent.innerHTML = details;
                 
                 // If it's a directory, also show the top 10 largest children
                 if (node.data.type === 'directory' && node.children && node.children.length > 0) {
@@ -666,15 +1272,14 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                     const value = document.createElement("div");
                     value.className = "detail-value";
                     
-                    // Display up to 10 largest children
-                    const sortedChildren = [...node.children]
-                        .sort((a, b) => b.value - a.value)
-                        .slice(0, 10);
+                    // Display up to 10 largest children; the hierarchy is
+                    // sorted by size once when it is built
+                    const largestChildren = node.children.slice(0, 10);
                     
-                    sortedChildren.forEach(child => {
+                    largestChildren.forEach(child => {
                         const item = document.createElement("div");
                         const percentage = (child.value / node.value * 100).toFixed(1);
-                        item.textContent = `${child.data.name} — ${child.data.human_size} (${percentage}%)`;
+                        item.textContent = `${child.data.name} — ${convertSize(child.data.size)} (${percentage}%)`;
                         item.style.cursor = "pointer";
                         item.style.marginBottom = "5px";
                         item.style.color = "#0066cc";
@@ -683,13 +1288,12 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                     });
                     
                     childrenList.appendChild(value);
-                    content.appendChild(childrenList);
+                    detailContent.appendChild(childrenList);
                 }
             }
             
             // Update the breadcrumb trail
             function updateBreadcrumb(nodes) {
-                const breadcrumb = d3.select(".breadcrumb");
                 breadcrumb.html("");
                 
                 nodes.forEach((node, i) => {
@@ -707,42 +1311,24 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
             
             // Update the center label
             function updateCenterLabel(node) {
-                // Remove existing label
-                svg.selectAll(".center-label").remove();
-                
-                // Add new label
-                svg.append("text")
-                    .attr("class", "center-label")
-                    .attr("dy", "0.35em")
-                    .attr("transform", "scale(0.1)")  // Scale the text to be readable
-                    .text(() => {
-                        if (node === root) {
-                            return "Click to zoom in";
-                        } else if (node.parent === null) {
-                            return "Current root";
-                        } else {
-                            return "↩ Back";
-                        }
-                    })
-                    .on("click", () => {
-                        if (node !== root && node.parent) {
-                            update(node.parent);
-                        }
-                    });
+                centerLabel.text(() => {
+                    if (node === root) {
+                        return root.data === data ? "Click to zoom in" : "New root";
+                    } else {
+                        return "↩ Back";
+                    }
+                });
             }
             
             // Update the legend
             function updateLegend(node) {
-                const legend = d3.select("#legend");
                 legend.html("");
                 
                 // Get direct children for the legend
                 const children = node.children || [];
                 
-                // Only show top 10 by size
-                const topItems = children
-                    .sort((a, b) => b.value - a.value)
-                    .slice(0, 10);
+                // Only show top 10 by size (children are already sorted)
+                const topItems = children.slice(0, 10);
                 
                 topItems.forEach(item => {
                     const row = legend.append("div")
@@ -755,7 +1341,7 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                     
                     const percentage = (item.value / node.value * 100).toFixed(1);
                     row.append("div")
-                        .text(`${item.data.name} (${item.data.human_size}, ${percentage}%)`);
+                        .text(`${item.data.name} (${convertSize(item.data.size)}, ${percentage}%)`);
                 });
             }
             
@@ -767,21 +1353,24 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
                 const ancestorPath = node.ancestors().reverse();
                 
                 // Update the visualization
-                path.transition()
-                    .duration(750)
-                    .attr("opacity", d => {
-                        // Show the node itself and all descendants
-                        const isDescendant = d.ancestors().includes(node);
-                        // Also show siblings if the node is not root
-                        const isSibling = node !== root && d.parent === node.parent;
-                        return isDescendant || isSibling ? 1 : 0.3;
-                    })
-                    .attr("pointer-events", d => {
-                        // Only the descendants should be clickable
-                        const isDescendant = d.ancestors().includes(node);
-                        const isSibling = node !== root && d.parent === node.parent;
-                        return isDescendant || isSibling ? "auto" : "none";
-                    });
+                renderArcs(node);
+                
+                // Work out once per arc whether it is in focus: the node itself,
+                // its descendants, and its siblings if the node is not root.
+                // Only arcs in focus are bright and clickable.
+                visible.forEach(d => {
+                    const isDescendant = d.ancestors().includes(node);
+                    const isSibling = node !== root && d.parent === node.parent;
+                    d.inFocus = isDescendant || isSibling;
+                });
+                if (useCanvas) {
+                    drawCanvas();
+                } else {
+                    path.attr("pointer-events", arcPointerEvents)
+                        .transition()
+                        .duration(750)
+                        .attr("opacity", arcOpacity);
+                }
                 
                 // Update panel and navigation
                 updateDetails(node);
@@ -794,160 +1383,24 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
             function setNewRoot(node) {
                 if (!node || !node.data) return;
                 
-                // Create a new visualization section for the new root
-                document.getElementById("chart-container").innerHTML = "";
-                
-                // Create a new SVG container
-                const newSvg = d3.select("#chart-container")
-                    .append("svg")
-                    .attr("width", width)
-                    .attr("height", height)
-                    .attr("viewBox", `0 0 ${width} ${height}`)
-                    .style("width", "100%")
-                    .style("height", "100%")
-                    .append("g")
-                    .attr("transform", `translate(${width / 2}, ${height / 2}) scale(10)`);
-                
-                // Create a new hierarchy with this node as root
-                const newRoot = d3.hierarchy(node.data)
-                    .sum(d => d.size)
-                    .sort((a, b) => b.value - a.value);
-                
-                // Apply partition layout
-                partition(newRoot);
-                
-                // Add center circle
-                newSvg.append("circle")
-                    .attr("fill", "white")
-                    .attr("r", radius / 150)
-                    .attr("stroke", "#ddd")
-                    .attr("stroke-width", 0.1)
-                    .style("cursor", "pointer")
-                    .on("click", () => {
-                        if (currentNode !== newRoot && currentNode.parent) {
-                            updateWithNewRoot(currentNode.parent, newRoot, newSvg);
-                        }
-                    });
-                
-                // Add center label
-                newSvg.append("text")
-                    .attr("class", "center-label")
-                    .attr("dy", "0.35em")
-                    .attr("transform", "scale(0.1)")
-                    .text("New root")
-                    .on("click", () => {
-                        if (currentNode !== newRoot && currentNode.parent) {
-                            updateWithNewRoot(currentNode.parent, newRoot, newSvg);
-                        }
-                    });
-                
-                // Create paths for all nodes in the new hierarchy
-                const newPath = newSvg.selectAll("path")
-                    .data(newRoot.descendants().slice(1))
-                    .enter().append("path")
-                    .attr("fill", d => {
-                        while (d.depth > 1) d = d.parent;
-                        return colorScale(d.data.name);
-                    })
-                    .attr("fill-opacity", d => 1 - d.depth * 0.1)
-                    .attr("d", arc)
-                    .on("click", (event, d) => {
-                        updateWithNewRoot(d, newRoot, newSvg);
-                        event.stopPropagation();
-                    })
-                    .on("dblclick", (event, d) => {
-                        setNewRoot(d);
-                        event.stopPropagation();
-                    })
-                    .on("mouseover", (event, d) => {
-                        tooltip.transition()
-                            .duration(200)
-                            .style("opacity", 0.9);
-                        tooltip.html(`${d.data.name} (${d.data.human_size})`)
-                            .style("left", (event.pageX + 10) + "px")
-                            .style("top", (event.pageY - 28) + "px");
-                    })
-                    .on("mouseout", () => {
-                        tooltip.transition()
-                            .duration(500)
-                            .style("opacity", 0);
-                    });
-                
-                // Background click handler
-                newSvg.on("click", () => {
-                    if (currentNode !== newRoot && currentNode.parent) {
-                        updateWithNewRoot(currentNode.parent, newRoot, newSvg);
-                    }
-                }).on("dblclick", () => {
-                    // Return to original root on double-click of background
-                    window.location.reload();
-                });
-                
-                // Update global references
-                svg = newSvg;
-                root = newRoot;
-                currentNode = newRoot;
-                path = newPath;
+                // Lay out a new hierarchy with this node as root; its ids
+                // restart at 0, so drop the old arcs rather than matching them
+                root = buildHierarchy(node.data);
+                partition(root);
+                path.remove();
+                path = arcLayer.selectAll("path");
                 
                 // Show reset button
-                document.querySelector(".reset-button").style.display = "block";
+                resetButton.style.display = "block";
                 
-                // Update visualization components
-                updateDetails(newRoot);
-                updateBreadcrumb([newRoot]);
-                updateLegend(newRoot);
-            }
-            
-            // Modified update function for the new root view
-            function updateWithNewRoot(node, newRoot, newSvg) {
-                currentNode = node;
-                
-                // Get the ancestors for breadcrumb
-                const ancestorPath = node.ancestors().reverse();
-                
-                // Update the visualization
-                path.transition()
-                    .duration(750)
-                    .attr("opacity", d => {
-                        // Show the node itself and all descendants
-                        const isDescendant = d.ancestors().includes(node);
-                        // Also show siblings if the node is not root
-                        const isSibling = node !== newRoot && d.parent === node.parent;
-                        return isDescendant || isSibling ? 1 : 0.3;
-                    })
-                    .attr("pointer-events", d => {
-                        // Only the descendants should be clickable
-                        const isDescendant = d.ancestors().includes(node);
-                        const isSibling = node !== newRoot && d.parent === node.parent;
-                        return isDescendant || isSibling ? "auto" : "none";
-                    });
-                
-                // Update panel and navigation
-                updateDetails(node);
-                updateBreadcrumb(ancestorPath);
-                updateLegend(node);
-                
-                // Update center label
-                newSvg.selectAll(".center-label").remove();
-                newSvg.append("text")
-                    .attr("class", "center-label")
-                    .attr("dy", "0.35em")
-                    .attr("transform", "scale(0.1)")
-                    .text(() => {
-                        if (node === newRoot) {
-                            return "New root";
-                        } else {
-                            return "↩ Back";
-                        }
-                    })
-                    .on("click", () => {
-                        if (node !== newRoot && node.parent) {
-                            updateWithNewRoot(node.parent, newRoot, newSvg);
-                        }
-                    });
+                update(root);
             }
             
             // Initialize visualization
+            renderArcs(root);
+            if (useCanvas) {
+                drawCanvas();
+            }
             updateDetails(root);
             updateBreadcrumb([root]);
             updateCenterLabel(root);
@@ -966,13 +1419,276 @@ def create_html_visualization(data, output_file="disk_visualization.html"):
     </body>
     </html>
     """
+
+# Split and encode once at import; the data is written between the two halves.
+# Output files are written in binary mode so orjson's bytes go straight to disk.
+HTML_PREFIX, HTML_SUFFIX = (part.encode('utf-8') for part in HTML_TEMPLATE.split('DATA_PLACEHOLDER', 1))
+# Where the data loader goes for a separate data file: just before the viewer script
+_VIEWER_SCRIPT_START = HTML_PREFIX.rindex(b'<script>')
+
+# With a separate data file the page is opened before that file is written,
+# so the viewer is held as an inert script and only run once the data loads.
+# Missing or half-loaded files are retried; the query string defeats caching.
+# Retries stop when the writer leaves window.diskDataError instead of the
+# data, or after LOAD_TIMEOUT_MS in case it stopped without leaving anything.
+DATA_LOADER = b"""<script>
+            const LOAD_TIMEOUT_MS = 10 * 60 * 1000;
+            const loadStart = Date.now();
+            document.getElementById("chart-container").textContent = "Loading scan data...";
+            (function loadData(attempt) {
+                const fail = message => {
+                    document.getElementById("chart-container").textContent =
+                        `Scan data could not be loaded: ${message}`;
+                };
+                const retry = () => {
+                    script.remove();
+                    if (Date.now() - loadStart > LOAD_TIMEOUT_MS) {
+                        fail("timed out waiting for " + DATA_SRC);
+                        return;
+                    }
+                    setTimeout(() => loadData(attempt + 1), 250);
+                };
+                const script = document.createElement("script");
+                script.src = DATA_SRC + "?" + attempt;
+                script.onerror = retry;
+                script.onload = () => {
+                    if (window.diskDataError) {
+                        fail(window.diskDataError);
+                        return;
+                    }
+                    if (!window.diskData) {
+                        retry();
+                        return;
+                    }
+                    document.getElementById("chart-container").textContent = "";
+                    const viewer = document.createElement("script");
+                    viewer.textContent = document.getElementById("viewer-script").textContent;
+                    document.body.appendChild(viewer);
+                };
+                document.head.appendChild(script);
+            })(0);
+        </script>
+        <script type="text/x-disk-viewer" id="viewer-script">"""
+
+_stdlib_json_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+def encode_json(value):
+    """Encode a value as compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value)
+        except orjson.JSONEncodeError:
+            # orjson rejects unpaired surrogates (legal in Windows file names)
+            pass
+    # 'replace' keeps names with unpaired surrogates from aborting the write
+    return _stdlib_json_encode(value).encode('utf-8', 'replace')
+
+def to_json_stream(node, f, min_frac=0):
+    """
+    Write a DirNode tree to the binary file f as positional JSON arrays.
+    
+    A file is [name, size, owner, mtime, atime]; a directory adds its
+    children array and, if it failed to scan, its error; a folded "other"
+    entry is [name, size]. Paths are left out and rebuilt by the viewer's
+    hydrate(). File records are built one directory at a time, so no
+    intermediate tree exists in memory.
+    
+    The tree is walked with an explicit stack rather than recursion, so
+    deeply nested paths can't hit Python's recursion limit.
+    
+    Args:
+        node: DirNode to write
+        f: File opened in binary mode
+        min_frac: Entries smaller than this fraction of their directory's size
+            are folded into a single "other" entry per directory
+    """
+    # Each item is a directory to open, a separator to write, or the
+    # (directory, threshold, written, other_count, other_size) needed to
+    # write its files and close it once its sub-directories are done
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, bytes):
+            f.write(item)
+        elif isinstance(item, tuple):
+            _write_files_and_close(f, *item)
+        else:
+            _open_directory(item, f, min_frac, stack)
+
+def _open_directory(node, f, min_frac, stack):
+    """Write a directory's header and push its sub-directories and closing onto the stack."""
+    header = [
+        node.name,
+        node.size,
+        node.owner,
+        None if node.mtime is None else int(node.mtime),
+        None if node.atime is None else int(node.atime)
+    ]
     
-    # Replace the placeholder with actual data
-    html_content = html_content.replace('DATA_PLACEHOLDER', json.dumps(data))
+    # Reopen the header array to append the children array
+    f.write(encode_json(header)[:-1])
+    f.write(b',[')
     
-    # Write HTML file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Arcs for entries below the threshold would be too thin to see, but
+    # they would still cost JSON and SVG elements
+    threshold = node.size * min_frac
+    other_count = other_size = 0
+    
+    kept = []
+    for child in node.children:
+        if child.size < threshold:
+            other_count += 1
+            other_size += child.size
+            continue
+        kept.append(child)
+    
+    # Pushed in reverse so they pop in order, with commas between them
+    stack.append((node, threshold, len(kept), other_count, other_size))
+    for i in range(len(kept) - 1, -1, -1):
+        stack.append(kept[i])
+        if i:
+            stack.append(b',')
+
+def _write_files_and_close(f, node, threshold, written, other_count, other_size):
+    """Write a directory's files after its sub-directories and close its arrays."""
+    files = []
+    for i, name in enumerate(node.names):
+        size = node.sizes[i]
+        if size < threshold:
+            other_count += 1
+            other_size += size
+            continue
+        files.append([name, size, node.owners[i], int(node.mtimes[i]), int(node.atimes[i])])
+    
+    if other_count:
+        files.append([f"(other: {other_count} item{'s' if other_count != 1 else ''})", other_size])
+    
+    if files:
+        if written:
+            f.write(b',')
+        f.write(encode_json(files)[1:-1])
+    
+    f.write(b']')
+    if node.error is not None:
+        f.write(b',' + encode_json(node.error))
+    f.write(b']')
+
+def write_tree(data, f, min_frac=0):
+    """
+    Write the scanned tree with what the viewer needs to rebuild paths.
+    
+    Args:
+        data: Scanned DirNode tree
+        f: File opened in binary mode
+        min_frac: Passed on to to_json_stream
+    """
+    f.write(b'{"sep":' + encode_json(os.sep) + b',"path":' + encode_json(data.path) + b',"tree":')
+    to_json_stream(data, f, min_frac)
+    f.write(b'}')
+
+def write_data_script(data, data_file, min_frac=0):
+    """
+    Write the JSON tree as a script that sets window.diskData.
+    
+    The script is written under a temporary name and renamed into place, so
+    a page that is already open never loads a half-written file. If writing
+    fails, the temporary file is removed and, where possible, a script that
+    sets window.diskDataError is left instead, so an open page stops waiting
+    and shows the error.
+    """
+    temp_file = data_file + '.tmp'
+    try:
+        with open(temp_file, 'wb') as f:
+            f.write(b'window.diskData = ')
+            write_tree(data, f, min_frac)
+            f.write(b';\n')
+        os.replace(temp_file, data_file)
+    except BaseException as e:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        try:
+            with open(data_file, 'wb') as f:
+                f.write(b'window.diskDataError = ' + encode_json(str(e) or type(e).__name__) + b';\n')
+        except OSError:
+            pass
+        raise
+
+def write_gzip_copy(path):
+    """
+    Write a gzip-compressed copy of a file next to it as path + '.gz'.
+    
+    The file is compressed from disk rather than encoded a second time, so
+    the tree is only walked once. Local static servers can send the copy
+    with Content-Encoding: gzip.
+    
+    Args:
+        path: File to compress
+    """
+    with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb', compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    return path + '.gz'
+
+def open_in_browser(output_file):
+    """Open the visualization in the default web browser."""
+    try:
+        file_url = f"file://{os.path.abspath(output_file)}"
+        print(f"Opening visualization in browser: {file_url}")
+        webbrowser.open(file_url)
+    except Exception as e:
+        print(f"Could not open browser automatically: {e}")
+        print(f"Please open the file manually: {output_file}")
+
+def create_html_visualization(data, output_file="disk_visualization.html", separate_data=False, min_frac=0,
+                              before_data=None, gzip_copy=False):
+    """
+    Create HTML file with the visualization.
+    
+    The JSON tree is streamed into the file between the two template halves
+    instead of being spliced into one large HTML string in memory.
+    
+    Args:
+        data: Scanned DirNode tree
+        output_file: Path of the HTML file
+        separate_data: Write the tree to a sibling .data.js file that the page
+            loads with a script tag, keeping the HTML itself small. A script
+            tag is used rather than fetch() because browsers block fetch on
+            file:// pages.
+        min_frac: Fold entries smaller than this fraction of their directory
+            into one "other" entry (0 keeps everything)
+        before_data: Called with output_file after the page is written but
+            before the separate data file, so the page can already be opening
+            while the data is written
+        gzip_copy: Also write .gz copies of the output files
+    """
+    if separate_data:
+        data_file = os.path.splitext(output_file)[0] + '.data.js'
+        # A data file left by an earlier run would be shown as this scan
+        if os.path.exists(data_file):
+            os.remove(data_file)
+        src = encode_json(os.path.basename(data_file))
+        with open(output_file, 'wb') as f:
+            f.write(HTML_PREFIX[:_VIEWER_SCRIPT_START])
+            f.write(DATA_LOADER.replace(b'DATA_SRC', src))
+            f.write(HTML_PREFIX[_VIEWER_SCRIPT_START + len(b'<script>'):])
+            f.write(b'window.diskData')
+            f.write(HTML_SUFFIX)
+        if before_data is not None:
+            before_data(output_file)
+        write_data_script(data, data_file, min_frac)
+        if gzip_copy:
+            write_gzip_copy(output_file)
+            write_gzip_copy(data_file)
+        return output_file
+    
+    with open(output_file, 'wb') as f:
+        f.write(HTML_PREFIX)
+        write_tree(data, f, min_frac)
+        f.write(HTML_SUFFIX)
+    
+    if gzip_copy:
+        write_gzip_copy(output_file)
     
     return output_file
 
@@ -980,46 +1696,69 @@ def main():
     parser = argparse.ArgumentParser(description='Scan a directory and create a visualization of disk usage.')
     parser.add_argument('--path', default='S:/', help='Path to scan (default: S:/)')
     parser.add_argument('--output', default='disk_visualization.html', help='Output HTML file (default: disk_visualization.html)')
-    parser.add_argument('--threads', type=int, default=16, help='Number of worker threads for scanning (default: 16)')
+    parser.add_argument('--threads', type=int, default=None,
+                        help='Number of scan workers; 1 scans inline without a pool (default: by drive type, '
+                             '16 fixed, 64 network, 4 removable)')
     parser.add_argument('--depth', type=int, default=None, help='Maximum directory depth to scan (default: unlimited)')
+    parser.add_argument('--owner-limit', type=int, default=50,
+                        help='Look up owners only for the N largest entries in each directory; 0 looks up all, '
+                             'negative values are rejected (default: 50)')
+    parser.add_argument('--processes', action='store_true', help='Scan in worker processes instead of threads')
+    parser.add_argument('--min-frac', type=float, default=0,
+                        help='Fold entries smaller than this fraction of their folder into one "other" item '
+                             '(0 <= value < 1, e.g. 0.002; default: 0, keep everything)')
+    parser.add_argument('--data-file', action='store_true',
+                        help='Write the scan data to a separate .data.js file next to the HTML')
+    parser.add_argument('--gzip', action='store_true',
+                        help='Also write gzip-compressed .gz copies of the output for serving over HTTP')
     parser.add_argument('--quiet', action='store_true', help='Reduce output verbosity')
     args = parser.parse_args()
+    if args.owner_limit < 0:
+        parser.error('--owner-limit must be 0 or more')
+    if args.threads is not None and args.threads < 1:
+        parser.error('--threads must be 1 or more')
+    # Written this way round so NaN is rejected too
+    if not 0 <= args.min_frac < 1:
+        parser.error('--min-frac must be at least 0 and below 1')
     
     verbose = not args.quiet
+    if args.threads is None:
+        args.threads = default_worker_count(args.path)
     
     if verbose:
         print(f"Starting disk space analyzer")
         print(f"Path: {args.path}")
         print(f"Output: {args.output}")
-        print(f"Threads: {args.threads}")
+        print(f"Workers: {args.threads} {'processes' if args.processes else 'threads'}")
         print(f"Max depth: {args.depth if args.depth is not None else 'unlimited'}")
         print("-" * 50)
     
     start_time = time.time()
     
     try:
-        data = scan_directory_fast(args.path, verbose=verbose, max_workers=args.threads, max_depth=args.depth)
+        data = scan_directory_fast(args.path, verbose=verbose, max_workers=args.threads, max_depth=args.depth,
+                                   use_processes=args.processes, owner_limit=args.owner_limit or None)
         
         if verbose:
             scan_time = time.time() - start_time
             print(f"Scan completed in {scan_time:.2f} seconds")
             print(f"Creating visualization...")
         
-        output_file = create_html_visualization(data, args.output)
+        # With a separate data file the browser is opened as soon as the page
+        # exists and shows a loading state while the data is still written
+        output_file = create_html_visualization(data, args.output, separate_data=args.data_file,
+                                                min_frac=args.min_frac,
+                                                before_data=open_in_browser if args.data_file else None,
+                                                gzip_copy=args.gzip)
         
         total_time = time.time() - start_time
         print(f"Visualization created: {output_file}")
         print(f"Total processing time: {total_time:.2f} seconds")
-        print(f"Open this file in your web browser to view the visualization.")
         
-        # Try to open the file automatically
-        try:
-            file_url = f"file://{os.path.abspath(output_file)}"
-            print(f"Opening visualization in browser: {file_url}")
-            webbrowser.open(file_url)
-        except Exception as e:
-            print(f"Could not open browser automatically: {e}")
-            print(f"Please open the file manually: {output_file}")
+        if not args.data_file:
+            print(f"Open this file in your web browser to view the visualization.")
+            # Try to open the file automatically
+            open_in_browser(output_file)
             
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")